@@ -4,18 +4,29 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import logging
+import operator
+import weakref
+from abc import ABC, abstractmethod
 from datetime import timedelta
-from typing import Any, Callable, Dict, List, Mapping, Optional, Set
+from typing import Any, Callable, ClassVar, Dict, List, Mapping, Optional, Set, Tuple
 
 import homeassistant.helpers.entity_registry as er
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.config_entries import device_registry as dr
 from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL
-from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.core import CoreState, Event, HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.device_registry import DeviceEntry, DeviceEntryType
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.device_registry import (
+    EVENT_DEVICE_REGISTRY_UPDATED,
+    DeviceEntry,
+    DeviceEntryType,
+)
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import (
@@ -38,12 +49,19 @@ from .const import (
     CONF_COORDINATOR_MESH,
     CONF_DEVICE_TRACKERS,
     CONF_ENTRY_RELOAD,
+    CONF_HOST_INDEX,
     CONF_LOGGING_JNAP_RESPONSE,
+    CONF_LOGGING_LEVELS,
     CONF_LOGGING_MODE,
     CONF_LOGGING_SERIAL,
+    CONF_MESH_DEVICE_ID,
     CONF_NODE,
+    CONF_NODES_BY_UNIQUE_ID,
+    CONF_REGISTRY_INDEX,
+    CONF_REGISTRY_INVALIDATORS,
     CONF_SCAN_INTERVAL_DEVICE_TRACKER,
     CONF_SERVICES_HANDLER,
+    CONF_UNSUB_REGISTRY_LISTENER,
     CONF_UNSUB_UPDATE_LISTENER,
     DEF_API_REQUEST_TIMEOUT,
     DEF_LOGGING_JNAP_RESPONSE,
@@ -70,9 +88,55 @@ EVENT_LOGGING_STOPPED: str = f"{DOMAIN}_logging_stopped"
 EVENT_NEW_DEVICE_ON_MESH: str = f"{DOMAIN}_new_device_on_mesh"
 EVENT_NEW_NODE_ON_MESH: str = f"{DOMAIN}_new_node_on_mesh"
 
+MESH_DEVICE_MODEL: str = f"{PYVELOP_NAME} ({PYVELOP_VERSION})"
+
 LOGGING_ON: str = logging.getLevelName(logging.DEBUG)
-LOGGING_OFF: str = logging.getLevelName(_LOGGER.level)
-LOGGING_REVERT: str = logging.getLevelName(logging.getLogger("").level)
+LOGGER_INTEGRATION: str = f"custom_components.{DOMAIN}"
+LOGGER_JNAP_RESPONSE: str = f"{PYVELOP_NAME}.jnap.verbose"
+
+_EVENT_PROPERTIES: Dict[str, Tuple[str, ...]] = {
+    EVENT_NEW_DEVICE_ON_MESH: (
+        "connected_adapters",
+        "description",
+        "manufacturer",
+        "model",
+        "name",
+        "operating_system",
+        "parent_name",
+        "serial",
+        "status",
+        "unique_id",
+    ),
+    EVENT_NEW_NODE_ON_MESH: (
+        "backhaul",
+        "connected_adapters",
+        "model",
+        "name",
+        "parent_name",
+        "serial",
+        "status",
+        "unique_id",
+    ),
+    EVENT_NEW_PARENT_NODE: (
+        "connected_adapters",
+        "model",
+        "name",
+        "serial",
+        "unique_id",
+    ),
+}
+_EVENT_GETTERS: Dict[str, operator.attrgetter] = {
+    event: operator.attrgetter(*props) for event, props in _EVENT_PROPERTIES.items()
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _slug(name: str) -> str:
+    """Slugify the given name.
+
+    Entity names are drawn from a small set so the results are cached.
+    """
+    return slugify(name)
 
 
 def _get_device_registry_entry(
@@ -88,30 +152,125 @@ def _get_device_registry_entry(
         ret: List[DeviceEntry] = [
             dr_device
             for dr_device in my_devices
-            if all(
-                [
-                    dr_device.manufacturer != PYVELOP_AUTHOR,
-                    dr_device.name.lower() != "mesh",
-                ]
-            )
+            if dr_device.manufacturer != PYVELOP_AUTHOR
+            and dr_device.name
+            and dr_device.name.lower() != "mesh"
         ]
     elif entry_type.lower() == "mesh":
         ret: List[DeviceEntry] = [
             dr_device
             for dr_device in my_devices
-            if all(
-                [
-                    dr_device.entry_type == DeviceEntryType.SERVICE,
-                    dr_device.manufacturer == PYVELOP_AUTHOR,
-                    dr_device.model == f"{PYVELOP_NAME} ({PYVELOP_VERSION})",
-                    dr_device.name.lower() == "mesh",
-                ]
-            )
+            if dr_device.entry_type is DeviceEntryType.SERVICE
+            and dr_device.manufacturer == PYVELOP_AUTHOR
+            and dr_device.model == MESH_DEVICE_MODEL
+            and dr_device.name
+            and dr_device.name.lower() == "mesh"
         ]
 
     return ret
 
 
+def _build_registry_index(
+    device_registry: dr.DeviceRegistry, config_entry_id: str
+) -> Dict[str, Any]:
+    """Index the registry entries for the given config entry.
+
+    Allows the nodes to be looked up without scanning the registry.
+    """
+    nodes: List[DeviceEntry] = _get_device_registry_entry(
+        config_entry_id=config_entry_id,
+        device_registry=device_registry,
+        entry_type="node",
+    )
+    return {
+        "node": nodes,
+        "node_by_serial": {
+            next(iter(dr_device.identifiers))[1].lower(): dr_device  # serial number
+            for dr_device in nodes
+        },
+    }
+
+
+def _get_mesh_device_id(hass: HomeAssistant, config_entry_id: str) -> Optional[str]:
+    """Retrieve the device_id of the Mesh from the registry."""
+    mesh_details: List[DeviceEntry] = _get_device_registry_entry(
+        config_entry_id=config_entry_id,
+        device_registry=dr.async_get(hass=hass),
+        entry_type="mesh",
+    )
+    if mesh_details:
+        return mesh_details[0].id
+
+    return None
+
+
+def _get_registry_index(hass: HomeAssistant, config_entry_id: str) -> Dict[str, Any]:
+    """Retrieve the registry index for the config entry.
+
+    The index is cached until the device registry is updated.
+    """
+    entry_data: Dict[str, Any] = hass.data[DOMAIN][config_entry_id]
+    if (ret := entry_data.get(CONF_REGISTRY_INDEX)) is None:
+        ret = entry_data[CONF_REGISTRY_INDEX] = _build_registry_index(
+            device_registry=dr.async_get(hass=hass), config_entry_id=config_entry_id
+        )
+
+    return ret
+
+
+@callback
+def _async_device_registry_updated(hass: HomeAssistant, evt: Event) -> None:
+    """Pass device registry updates on to each of the config entries."""
+    for invalidator in list(
+        hass.data[DOMAIN].get(CONF_REGISTRY_INVALIDATORS, {}).values()
+    ):
+        invalidator(evt)
+
+
+@callback
+def _async_invalidate_registry_cache(
+    hass: HomeAssistant, config_entry_id: str, evt: Event
+) -> None:
+    """Invalidate the cached registry details for the config entry."""
+    entry_data: Dict[str, Any] = hass.data[DOMAIN].get(config_entry_id, {})
+    entry_data.pop(CONF_REGISTRY_INDEX, None)
+    if evt.data.get("action") == "create":
+        if entry_data.get(CONF_MESH_DEVICE_ID) is None:
+            entry_data[CONF_MESH_DEVICE_ID] = _get_mesh_device_id(
+                hass=hass, config_entry_id=config_entry_id
+            )
+    elif evt.data.get("action") == "remove":
+        if evt.data.get("device_id") == entry_data.get(CONF_MESH_DEVICE_ID):
+            entry_data[CONF_MESH_DEVICE_ID] = None
+
+
+@callback
+def _async_remove_registry_invalidator(
+    hass: HomeAssistant, config_entry_id: str
+) -> None:
+    """Stop passing registry updates to the config entry.
+
+    The shared listener is removed when no config entries are left using it.
+    """
+    invalidators: Dict[str, Callable] = hass.data[DOMAIN].get(
+        CONF_REGISTRY_INVALIDATORS, {}
+    )
+    invalidators.pop(config_entry_id, None)
+    if not invalidators and (
+        unsub := hass.data[DOMAIN].pop(CONF_UNSUB_REGISTRY_LISTENER, None)
+    ):
+        unsub()
+
+
+def _ensure_registry_listener(hass: HomeAssistant) -> None:
+    """Listen for device registry updates on behalf of all config entries."""
+    if hass.data[DOMAIN].get(CONF_UNSUB_REGISTRY_LISTENER) is None:
+        hass.data[DOMAIN][CONF_UNSUB_REGISTRY_LISTENER] = hass.bus.async_listen(
+            EVENT_DEVICE_REGISTRY_UPDATED,
+            functools.partial(_async_device_registry_updated, hass),
+        )
+
+
 def build_event_payload(
     config_entry: ConfigEntry,
     event: str,
@@ -119,54 +278,21 @@ def build_event_payload(
     device: Optional[Device | Node] = None,
 ) -> Dict[str, Any]:
     """Build the payload for the fired events."""
-    event_properties: List[str] = []
-
-    if event == EVENT_NEW_NODE_ON_MESH:
-        event_properties = [
-            "backhaul",
-            "connected_adapters",
-            "model",
-            "name",
-            "parent_name",
-            "serial",
-            "status",
-            "unique_id",
-        ]
-    elif event == EVENT_NEW_DEVICE_ON_MESH:
-        event_properties = [
-            "connected_adapters",
-            "description",
-            "manufacturer",
-            "model",
-            "name",
-            "operating_system",
-            "parent_name",
-            "serial",
-            "status",
-            "unique_id",
-        ]
-    elif event == EVENT_NEW_PARENT_NODE:
-        event_properties = [
-            "connected_adapters",
-            "model",
-            "name",
-            "serial",
-            "unique_id",
-        ]
-
+    ret: Dict[str, Any] = {}
     if device:
-        ret: Dict[str, Any] = {
-            prop: getattr(device, prop, None) for prop in event_properties
-        }
+        event_properties: Tuple[str, ...] = _EVENT_PROPERTIES.get(event, ())
+        if event_properties:
+            try:
+                ret = dict(zip(event_properties, _EVENT_GETTERS[event](device)))
+            except AttributeError:
+                ret = {prop: getattr(device, prop, None) for prop in event_properties}
         if ret:
             # region #-- get the mesh device_id --#
-            mesh_details: List[DeviceEntry] = _get_device_registry_entry(
-                config_entry_id=config_entry.entry_id,
-                device_registry=dr.async_get(hass=hass),
-                entry_type="mesh",
-            )
-            if mesh_details:
-                ret["mesh_device_id"] = mesh_details[0].id
+            mesh_device_id: Optional[str] = hass.data[DOMAIN][
+                config_entry.entry_id
+            ].get(CONF_MESH_DEVICE_ID)
+            if mesh_device_id:
+                ret["mesh_device_id"] = mesh_device_id
             # endregion
     else:
         if event == EVENT_LOGGING_STOPPED:
@@ -178,14 +304,40 @@ def build_event_payload(
 async def async_logging_state(
     config_entry: ConfigEntry, hass: HomeAssistant, log_formatter: Logger, state: bool
 ) -> None:
-    """Turn logging on or off."""
-    logging_level: str = LOGGING_ON if state else LOGGING_OFF
-    if logging_level == LOGGING_ON and config_entry.options.get(
-        CONF_LOGGING_JNAP_RESPONSE, DEF_LOGGING_JNAP_RESPONSE
-    ):
-        logging_level_jnap_response: str = LOGGING_ON
+    """Turn logging on or off.
+
+    The levels in use the first time this is called for any config entry are
+    the ones restored when logging is turned off.  They are held for the
+    integration, rather than each config entry, so that an entry set up
+    alongside another can't pick up the levels that the other has just set.
+    """
+    logging_off: str
+    logging_revert: str
+    logging_off, logging_revert = hass.data.setdefault(DOMAIN, {}).setdefault(
+        CONF_LOGGING_LEVELS,
+        (
+            logging.getLevelName(_LOGGER.level),
+            logging.getLevelName(logging.getLogger("").level),
+        ),
+    )
+    if state:
+        service_data: Dict[str, str] = {
+            LOGGER_INTEGRATION: LOGGING_ON,
+            PYVELOP_NAME: LOGGING_ON,
+            LOGGER_JNAP_RESPONSE: LOGGING_ON
+            if config_entry.options.get(
+                CONF_LOGGING_JNAP_RESPONSE, DEF_LOGGING_JNAP_RESPONSE
+            )
+            else logging_revert,
+        }
     else:
-        logging_level_jnap_response: str = LOGGING_REVERT
+        service_data: Dict[str, str] = {
+            LOGGER_INTEGRATION: logging_off,
+            PYVELOP_NAME: logging_off,
+            LOGGER_JNAP_RESPONSE: logging_revert,
+        }
+    logging_level: str = service_data[LOGGER_INTEGRATION]
+    logging_level_jnap_response: str = service_data[LOGGER_JNAP_RESPONSE]
     if not state:
         _LOGGER.debug(log_formatter.format("log state: %s"), logging_level)
         _LOGGER.debug(
@@ -196,11 +348,7 @@ async def async_logging_state(
         blocking=True,
         domain="logger",
         service="set_level",
-        service_data={
-            f"custom_components.{DOMAIN}": logging_level,
-            PYVELOP_NAME: logging_level,
-            f"{PYVELOP_NAME}.jnap.verbose": logging_level_jnap_response,
-        },
+        service_data=service_data,
     )
     _LOGGER.debug(log_formatter.format("log state: %s"), logging_level)
     _LOGGER.debug(
@@ -241,7 +389,7 @@ async def async_remove_config_entry_device(
         [  # check for Mesh device
             device_entry.name == "Mesh",
             device_entry.manufacturer == PYVELOP_AUTHOR,
-            device_entry.model == f"{PYVELOP_NAME} ({PYVELOP_VERSION})",
+            device_entry.model == MESH_DEVICE_MODEL,
         ]
     ):
         _LOGGER.error(
@@ -252,6 +400,220 @@ async def async_remove_config_entry_device(
     return True
 
 
+async def _async_get_mesh_data(
+    hass: HomeAssistant, config_entry: ConfigEntry, log_formatter: Logger
+) -> Mesh:
+    """Fetch the latest data from the Mesh.
+
+    Will signal relevant sensors that have a state that needs updating more frequently
+    """
+    _LOGGER.debug(log_formatter.format("entered"))
+
+    entry_data: Dict[str, Any] = hass.data[DOMAIN][config_entry.entry_id]
+    mesh: Mesh = entry_data[CONF_COORDINATOR_MESH]
+    device_registry: dr.DeviceRegistry = dr.async_get(hass=hass)
+    registry_index: Dict[str, Any] = _get_registry_index(
+        hass=hass, config_entry_id=config_entry.entry_id
+    )
+
+    # -- get the existing devices --#
+    _LOGGER.debug(log_formatter.format("retrieving existing devices for comparison"))
+    device: Device
+    try:
+        previous_devices: Set[str] = {device.unique_id for device in mesh.devices}
+    except MeshException:
+        previous_devices: Set[str] = {}
+
+    # -- get the existing nodes --#
+    _LOGGER.debug(log_formatter.format("retrieving existing nodes for comparison"))
+    previous_nodes: List[DeviceEntry] = registry_index["node"]
+
+    try:
+        # -- gather details from the API --#
+        _LOGGER.debug(log_formatter.format("gathering details"))
+        await mesh.async_gather_details()
+        if mesh.speedtest_status:
+            _LOGGER.debug(log_formatter.format("dispatching speedtest signal"))
+            async_dispatcher_send(hass, SIGNAL_UPDATE_SPEEDTEST_STATUS)
+    except MeshTimeoutError as err:
+        _LOGGER.warning(
+            log_formatter.format(
+                "timeout gathering data from the mesh (current timeout: %.2f) - consider increasing the timeout"
+            ),
+            config_entry.options.get(CONF_API_REQUEST_TIMEOUT, DEF_API_REQUEST_TIMEOUT),
+        )
+        raise UpdateFailed(err) from err
+    except Exception as err:
+        _LOGGER.debug(log_formatter.format("error type: %s"), type(err))
+        _LOGGER.error(log_formatter.format(err))
+        raise UpdateFailed(err) from err
+    else:
+        # region #-- check for new devices --#
+        if not previous_devices:
+            _LOGGER.debug(
+                log_formatter.format("no previous devices - ignoring comparison")
+            )
+        else:
+            _LOGGER.debug(log_formatter.format("comparing devices"))
+            current_devices: Set[str] = {device.unique_id for device in mesh.devices}
+            new_devices: Set[str] = current_devices.difference(previous_devices)
+            if new_devices:
+                payloads: List[Dict[str, Any]] = [
+                    build_event_payload(
+                        config_entry=config_entry,
+                        device=device,
+                        event=EVENT_NEW_DEVICE_ON_MESH,
+                        hass=hass,
+                    )
+                    for device in mesh.devices
+                    if device.unique_id in new_devices
+                ]
+                # -- fire the events --#
+                for payload in payloads:
+                    _LOGGER.debug(
+                        log_formatter.format("%s: %s"),
+                        EVENT_NEW_DEVICE_ON_MESH,
+                        payload,
+                    )
+                    hass.bus.async_fire(
+                        event_type=EVENT_NEW_DEVICE_ON_MESH, event_data=payload
+                    )
+            _LOGGER.debug(log_formatter.format("devices compared"))
+        # endregion
+
+        # region #-- check for new or update nodes --#
+        node: Node
+        current_nodes_by_serial: Dict[str, Node] = {}
+        nodes_by_uid: Dict[str, Node] = {}
+        primary_node: Optional[Node] = None
+        prev_nodes_by_serial: Dict[str, DeviceEntry] = registry_index["node_by_serial"]
+        update_properties = ["name"]
+        if not previous_nodes:
+            _LOGGER.debug(
+                log_formatter.format("no previous nodes - ignoring comparison")
+            )
+        else:
+            _LOGGER.debug(log_formatter.format("comparing nodes"))
+        for node in mesh.nodes:
+            serial: str = node.serial.lower()
+            current_nodes_by_serial[serial] = node
+            nodes_by_uid[node.unique_id] = node
+            if primary_node is None and node.type == "primary":
+                primary_node = node
+
+            # region #-- look for updates to the node --#
+            previous_node: Optional[DeviceEntry] = prev_nodes_by_serial.get(serial)
+            if previous_node is None:
+                continue
+
+            for prop in update_properties:
+                previous_value = getattr(previous_node, prop, None)
+                current_value = getattr(node, prop, None)
+                if previous_value != current_value:
+                    _LOGGER.debug(
+                        log_formatter.format("updating %s for %s (%s --> %s)"),
+                        prop,
+                        node.serial,
+                        previous_value,
+                        current_value,
+                    )
+                    device_registry.async_update_device(
+                        device_id=previous_node.id, name=current_value
+                    )
+            # endregion
+        entry_data[CONF_NODES_BY_UNIQUE_ID] = nodes_by_uid
+
+        if previous_nodes:
+            # region #-- process new nodes --#
+            new_nodes: Set[str] = (
+                current_nodes_by_serial.keys() - prev_nodes_by_serial.keys()
+            )
+            is_reloading = (
+                hass.data[DOMAIN].get(CONF_ENTRY_RELOAD, {}).get(config_entry.entry_id)
+            )
+            if new_nodes and not is_reloading:
+                for serial, node in current_nodes_by_serial.items():
+                    if serial in new_nodes:
+                        _LOGGER.debug(
+                            log_formatter.format("new node found: %s"), node.serial
+                        )
+                        if hass.state == CoreState.running:  # reload the config
+                            if CONF_ENTRY_RELOAD not in hass.data[DOMAIN]:
+                                hass.data[DOMAIN][CONF_ENTRY_RELOAD] = {}
+                            hass.data[DOMAIN][CONF_ENTRY_RELOAD][
+                                config_entry.entry_id
+                            ] = True
+                            await hass.config_entries.async_reload(
+                                config_entry.entry_id
+                            )
+                            hass.data[DOMAIN].get(CONF_ENTRY_RELOAD, {}).pop(
+                                config_entry.entry_id, None
+                            )
+
+                        # -- fire the event --#
+                        payload = build_event_payload(
+                            config_entry=config_entry,
+                            device=node,
+                            event=EVENT_NEW_DEVICE_ON_MESH,
+                            hass=hass,
+                        )
+                        _LOGGER.debug(
+                            log_formatter.format("%s: %s"),
+                            EVENT_NEW_NODE_ON_MESH,
+                            payload,
+                        )
+                        hass.bus.async_fire(
+                            event_type=EVENT_NEW_NODE_ON_MESH, event_data=payload
+                        )
+            # endregion
+            _LOGGER.debug(log_formatter.format("nodes compared"))
+        # endregion
+
+        # region #-- check for a primary node change --#
+        if primary_node and primary_node.serial != config_entry.unique_id:
+            _LOGGER.debug(log_formatter.format("assuming the primary node has changed"))
+            if hass.state == CoreState.running:
+                if hass.config_entries.async_update_entry(
+                    entry=config_entry, unique_id=primary_node.serial
+                ):
+                    payload: Dict[str, Any] = build_event_payload(
+                        config_entry=config_entry,
+                        device=primary_node,
+                        event=EVENT_NEW_PARENT_NODE,
+                        hass=hass,
+                    )
+                    hass.bus.async_fire(
+                        event_type=EVENT_NEW_PARENT_NODE, event_data=payload
+                    )
+            else:
+                _LOGGER.debug(
+                    log_formatter.format(
+                        "backing off updates until HASS is fully running"
+                    )
+                )
+        # endregion
+
+        entry_data[CONF_COORDINATOR_MESH] = mesh
+
+    _LOGGER.debug(log_formatter.format("exited"))
+    return mesh
+
+
+async def _async_device_tracker_update(
+    hass: HomeAssistant, _: datetime.datetime
+) -> None:
+    """Manage the device tracker updates.
+
+    Uses the _ variable to ignore IDE checking for unused variables
+
+    Gets the device list from the mesh before dispatching the message
+
+    :param _: datetime object for when the event was fired
+    :return: None
+    """
+    async_dispatcher_send(hass, SIGNAL_UPDATE_DEVICE_TRACKER)
+
+
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Create a config entry."""
     if config_entry.options.get(CONF_LOGGING_SERIAL, DEF_LOGGING_SERIAL):
@@ -279,7 +641,23 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     # region #-- prepare the memory storage --#
     _LOGGER.debug(log_formatter.format("preparing memory storage"))
     hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN].pop(CONF_HOST_INDEX, None)
     hass.data[DOMAIN].setdefault(config_entry.entry_id, {})
+    hass.data[DOMAIN][config_entry.entry_id][CONF_MESH_DEVICE_ID] = _get_mesh_device_id(
+        hass=hass, config_entry_id=config_entry.entry_id
+    )
+    # endregion
+
+    # region #-- listen for device registry changes --#
+    _ensure_registry_listener(hass=hass)
+    hass.data[DOMAIN].setdefault(CONF_REGISTRY_INVALIDATORS, {})[
+        config_entry.entry_id
+    ] = functools.partial(_async_invalidate_registry_cache, hass, config_entry.entry_id)
+    config_entry.async_on_unload(
+        functools.partial(
+            _async_remove_registry_invalidator, hass, config_entry.entry_id
+        )
+    )
     # endregion
 
     # region #-- setup the coordinator for data updates --#
@@ -293,210 +671,6 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         session=async_get_clientsession(hass=hass),
     )
 
-    async def _async_get_mesh_data() -> Mesh:
-        """Fetch the latest data from the Mesh.
-
-        Will signal relevant sensors that have a state that needs updating more frequently
-        """
-        _LOGGER.debug(log_formatter.format("entered"))
-
-        mesh: Mesh = hass.data[DOMAIN][config_entry.entry_id][CONF_COORDINATOR_MESH]
-        device_registry: dr.DeviceRegistry = dr.async_get(hass=hass)
-
-        # -- get the existing devices --#
-        _LOGGER.debug(
-            log_formatter.format("retrieving existing devices for comparison")
-        )
-        device: Device
-        try:
-            previous_devices: Set[str] = {device.unique_id for device in mesh.devices}
-        except MeshException:
-            previous_devices: Set[str] = {}
-
-        # -- get the existing nodes --#
-        _LOGGER.debug(log_formatter.format("retrieving existing nodes for comparison"))
-        previous_nodes = _get_device_registry_entry(
-            config_entry_id=config_entry.entry_id,
-            device_registry=device_registry,
-            entry_type="node",
-        )
-        previous_nodes_serials: Set[str] = {
-            next(iter(prev_node.identifiers))[1]  # serial number of node
-            for prev_node in previous_nodes
-        }
-
-        try:
-            # -- gather details from the API --#
-            _LOGGER.debug(log_formatter.format("gathering details"))
-            await mesh.async_gather_details()
-            if mesh.speedtest_status:
-                _LOGGER.debug(log_formatter.format("dispatching speedtest signal"))
-                async_dispatcher_send(hass, SIGNAL_UPDATE_SPEEDTEST_STATUS)
-        except MeshTimeoutError as err:
-            _LOGGER.warning(
-                log_formatter.format(
-                    "timeout gathering data from the mesh (current timeout: %.2f) - consider increasing the timeout"
-                ),
-                config_entry.options.get(
-                    CONF_API_REQUEST_TIMEOUT, DEF_API_REQUEST_TIMEOUT
-                ),
-            )
-            raise UpdateFailed(err) from err
-        except Exception as err:
-            _LOGGER.debug(log_formatter.format("error type: %s"), type(err))
-            _LOGGER.error(log_formatter.format(err))
-            raise UpdateFailed(err) from err
-        else:
-            # region #-- check for new devices --#
-            if not previous_devices:
-                _LOGGER.debug(
-                    log_formatter.format("no previous devices - ignoring comparison")
-                )
-            else:
-                _LOGGER.debug(log_formatter.format("comparing devices"))
-                current_devices: Set[str] = {
-                    device.unique_id for device in mesh.devices
-                }
-                new_devices: Set[str] = current_devices.difference(previous_devices)
-                if new_devices:
-                    for device in mesh.devices:
-                        if device.unique_id in new_devices:
-                            # -- fire the event --#
-                            payload = build_event_payload(
-                                config_entry=config_entry,
-                                device=device,
-                                event=EVENT_NEW_DEVICE_ON_MESH,
-                                hass=hass,
-                            )
-                            _LOGGER.debug(
-                                log_formatter.format("%s: %s"),
-                                EVENT_NEW_DEVICE_ON_MESH,
-                                payload,
-                            )
-                            hass.bus.async_fire(
-                                event_type=EVENT_NEW_DEVICE_ON_MESH, event_data=payload
-                            )
-                _LOGGER.debug(log_formatter.format("devices compared"))
-            # endregion
-
-            # region #-- check for new or update nodes --#
-            if not previous_nodes:
-                _LOGGER.debug(
-                    log_formatter.format("no previous nodes - ignoring comparison")
-                )
-            else:
-                _LOGGER.debug(log_formatter.format("comparing nodes"))
-                node: Node
-                current_nodes: Set[str] = {node.serial for node in mesh.nodes}
-                # region #-- process new nodes --#
-                new_nodes: Set[str] = current_nodes.difference(previous_nodes_serials)
-                is_reloading = (
-                    hass.data[DOMAIN]
-                    .get(CONF_ENTRY_RELOAD, {})
-                    .get(config_entry.entry_id)
-                )
-                if new_nodes and not is_reloading:
-                    for node in mesh.nodes:
-                        if node.serial in new_nodes:
-                            _LOGGER.debug(
-                                log_formatter.format("new node found: %s"), node.serial
-                            )
-                            if hass.state == CoreState.running:  # reload the config
-                                if CONF_ENTRY_RELOAD not in hass.data[DOMAIN]:
-                                    hass.data[DOMAIN][CONF_ENTRY_RELOAD] = {}
-                                hass.data[DOMAIN][CONF_ENTRY_RELOAD][
-                                    config_entry.entry_id
-                                ] = True
-                                await hass.config_entries.async_reload(
-                                    config_entry.entry_id
-                                )
-                                hass.data[DOMAIN].get(CONF_ENTRY_RELOAD, {}).pop(
-                                    config_entry.entry_id, None
-                                )
-
-                            # -- fire the event --#
-                            payload = build_event_payload(
-                                config_entry=config_entry,
-                                device=node,
-                                event=EVENT_NEW_DEVICE_ON_MESH,
-                                hass=hass,
-                            )
-                            _LOGGER.debug(
-                                log_formatter.format("%s: %s"),
-                                EVENT_NEW_NODE_ON_MESH,
-                                payload,
-                            )
-                            hass.bus.async_fire(
-                                event_type=EVENT_NEW_NODE_ON_MESH, event_data=payload
-                            )
-                # endregion
-                # region #-- look for updates to nodes --#
-                update_properties = ["name"]
-                for node in mesh.nodes:
-                    previous_node: List[
-                        DeviceEntry
-                    ] = [  # get the node from the device registry based on serial
-                        prev_node
-                        for prev_node in previous_nodes
-                        if next(iter(prev_node.identifiers))[1].lower()
-                        == node.serial.lower()
-                    ]
-                    if not previous_node:
-                        continue
-
-                    for prop in update_properties:
-                        if getattr(previous_node[0], prop, None) != getattr(
-                            node, prop, None
-                        ):
-                            _LOGGER.debug(
-                                log_formatter.format("updating %s for %s (%s --> %s)"),
-                                prop,
-                                node.serial,
-                                getattr(previous_node[0], prop, None),
-                                getattr(node, prop),
-                            )
-                            device_registry.async_update_device(
-                                device_id=previous_node[0].id, name=getattr(node, prop)
-                            )
-
-                # endregion
-                _LOGGER.debug(log_formatter.format("nodes compared"))
-            # endregion
-
-            # region #-- check for a primary node change --#
-            primary_node: List[Node] = [
-                node for node in mesh.nodes if node.type == "primary"
-            ]
-            if primary_node and primary_node[0].serial != config_entry.unique_id:
-                _LOGGER.debug(
-                    log_formatter.format("assuming the primary node has changed")
-                )
-                if hass.state == CoreState.running:
-                    if hass.config_entries.async_update_entry(
-                        entry=config_entry, unique_id=primary_node[0].serial
-                    ):
-                        payload: Dict[str, Any] = build_event_payload(
-                            config_entry=config_entry,
-                            device=primary_node[0],
-                            event=EVENT_NEW_PARENT_NODE,
-                            hass=hass,
-                        )
-                        hass.bus.async_fire(
-                            event_type=EVENT_NEW_PARENT_NODE, event_data=payload
-                        )
-                else:
-                    _LOGGER.debug(
-                        log_formatter.format(
-                            "backing off updates until HASS is fully running"
-                        )
-                    )
-            # endregion
-
-            hass.data[DOMAIN][config_entry.entry_id][CONF_COORDINATOR_MESH] = mesh
-
-        _LOGGER.debug(log_formatter.format("exited"))
-        return mesh
-
     _LOGGER.debug(log_formatter.format("setting up the coordinator"))
     coordinator_name = DOMAIN
     if getattr(log_formatter, "_unique_id"):
@@ -506,7 +680,9 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         logger=_LOGGER,
         name=coordinator_name,
         update_interval=timedelta(seconds=config_entry.options[CONF_SCAN_INTERVAL]),
-        update_method=_async_get_mesh_data,
+        update_method=functools.partial(
+            _async_get_mesh_data, hass, config_entry, log_formatter
+        ),
     )
     await coordinator.async_config_entry_first_refresh()
 
@@ -522,15 +698,12 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         )
 
     # region #-- setup the platforms --#
-    setup_platforms: List[str] = list(filter(None, PLATFORMS))
-    _LOGGER.debug(log_formatter.format("setting up platforms: %s"), setup_platforms)
+    _LOGGER.debug(log_formatter.format("setting up platforms: %s"), PLATFORMS)
     # TODO: remove try/except when minimum version is 2022.8.0
     try:
-        await hass.config_entries.async_forward_entry_setups(
-            config_entry, setup_platforms
-        )
+        await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
     except AttributeError:
-        hass.config_entries.async_setup_platforms(config_entry, setup_platforms)
+        hass.config_entries.async_setup_platforms(config_entry, PLATFORMS)
     # endregion
 
     # region #-- Service Definition --#
@@ -547,32 +720,22 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     ] = config_entry.add_update_listener(_async_update_listener)
     # endregion
 
-    async def device_tracker_update(_: datetime.datetime) -> None:
-        """Manage the device tracker updates.
-
-        Uses the _ variable to ignore IDE checking for unused variables
-
-        Gets the device list from the mesh before dispatching the message
-
-        :param _: datetime object for when the event was fired
-        :return: None
-        """
-        async_dispatcher_send(hass, SIGNAL_UPDATE_DEVICE_TRACKER)
-
     # region #-- set up the timer for checking device trackers --#
     if config_entry.options[
         CONF_DEVICE_TRACKERS
     ]:  # only do setup if device trackers were selected
         _LOGGER.debug(log_formatter.format("setting up device trackers"))
-        await device_tracker_update(
-            datetime.datetime.now()
+        await _async_device_tracker_update(
+            hass=hass, _=datetime.datetime.now()
         )  # update before setting the timer
         scan_interval = config_entry.options.get(
             CONF_SCAN_INTERVAL_DEVICE_TRACKER, DEF_SCAN_INTERVAL_DEVICE_TRACKER
         )
         config_entry.async_on_unload(
             async_track_time_interval(
-                hass, device_tracker_update, timedelta(seconds=scan_interval)
+                hass,
+                functools.partial(_async_device_tracker_update, hass),
+                timedelta(seconds=scan_interval),
             )
         )
     # endregion
@@ -616,6 +779,7 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         ret = True
     else:
         ret = False
+    hass.data[DOMAIN].pop(CONF_HOST_INDEX, None)
     # endregion
 
     _LOGGER.debug(log_formatter.format("exited"))
@@ -630,9 +794,44 @@ async def _async_update_listener(
 
 
 # region #-- base entities --#
+async def _async_dispatcher_update(entity_ref: weakref.ref) -> None:
+    """Pass a dispatcher signal on to the entity if it still exists."""
+    if (entity := entity_ref()) is not None:
+        await entity.async_handle_dispatcher_update()
+
+
+class LinksysVelopDispatcherMixin(ABC):
+    """Connect an entity to a dispatcher signal for as long as it is in Home Assistant.
+
+    Entities set the signal to listen for, provide the coroutine to run when it is sent and call
+    _async_connect_dispatcher when they are added to Home Assistant.
+    """
+
+    __slots__ = ()
+
+    _dispatcher_signal: ClassVar[str]
+
+    @callback
+    def _async_connect_dispatcher(self) -> None:
+        """Listen for the dispatcher signal until the entity is removed."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                hass=self.hass,
+                signal=self._dispatcher_signal,
+                target=functools.partial(_async_dispatcher_update, weakref.ref(self)),
+            )
+        )
+
+    @abstractmethod
+    async def async_handle_dispatcher_update(self) -> None:
+        """Respond to the dispatcher signal."""
+
+
 class LinksysVelopMeshEntity(CoordinatorEntity):
     """Representation of a Mesh entity."""
 
+    __slots__ = ("_config", "_mesh", "entity_domain")
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -659,15 +858,17 @@ class LinksysVelopMeshEntity(CoordinatorEntity):
         self._attr_unique_id = (
             f"{config_entry.entry_id}::"
             f"{self.entity_domain.lower()}::"
-            f"{slugify(self.entity_description.name)}"
+            f"{_slug(self.entity_description.name)}"
         )
 
     def _handle_coordinator_update(self) -> None:
         """Update the information when the coordinator updates."""
         self._mesh = self.coordinator.data
+        self.__dict__.pop("device_info", None)
+        self.__dict__.pop("extra_state_attributes", None)
         super()._handle_coordinator_update()
 
-    @property
+    @functools.cached_property
     def device_info(self) -> DeviceInfo:
         """Return the device information of the entity."""
         # noinspection HttpUrlsUsage
@@ -676,13 +877,13 @@ class LinksysVelopMeshEntity(CoordinatorEntity):
             entry_type=DeviceEntryType.SERVICE,
             identifiers={(DOMAIN, self._config.entry_id)},
             manufacturer=PYVELOP_AUTHOR,
-            model=f"{PYVELOP_NAME} ({PYVELOP_VERSION})",
+            model=MESH_DEVICE_MODEL,
             name="Mesh",
             sw_version="",
         )
         return ret
 
-    @property
+    @functools.cached_property
     def extra_state_attributes(self) -> Optional[Mapping[str, Any]]:
         """Additional attributes for the entity."""
         if hasattr(self.entity_description, "extra_attributes") and isinstance(
@@ -694,6 +895,8 @@ class LinksysVelopMeshEntity(CoordinatorEntity):
 class LinksysVelopNodeEntity(CoordinatorEntity):
     """Representation of a Node entity."""
 
+    __slots__ = ("_config", "_mesh", "_node", "_node_id", "entity_domain")
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -725,11 +928,19 @@ class LinksysVelopNodeEntity(CoordinatorEntity):
         self._attr_unique_id = (
             f"{self._node.unique_id}::"
             f"{self.entity_domain.lower()}::"
-            f"{slugify(self.entity_description.name)}"
+            f"{_slug(self.entity_description.name)}"
         )
 
     def _get_node(self) -> Optional[Node]:
         """Get the current node."""
+        nodes_by_uid: Optional[Dict[str, Node]] = (
+            self.coordinator.hass.data[DOMAIN]
+            .get(self._config.entry_id, {})
+            .get(CONF_NODES_BY_UNIQUE_ID)
+        )
+        if nodes_by_uid is not None:
+            return nodes_by_uid.get(self._node_id)
+
         node = [n for n in self._mesh.nodes if n.unique_id == self._node_id]
         if node:
             return node[0]
@@ -740,9 +951,11 @@ class LinksysVelopNodeEntity(CoordinatorEntity):
         """Update the information when the coordinator updates."""
         self._mesh = self.coordinator.data
         self._node = self._get_node()
+        self.__dict__.pop("device_info", None)
+        self.__dict__.pop("extra_state_attributes", None)
         super()._handle_coordinator_update()
 
-    @property
+    @functools.cached_property
     def device_info(self) -> DeviceInfo:
         """Return the device information of the entity."""
         ret = DeviceInfo(
@@ -760,7 +973,7 @@ class LinksysVelopNodeEntity(CoordinatorEntity):
 
         return ret
 
-    @property
+    @functools.cached_property
     def extra_state_attributes(self) -> Optional[Mapping[str, Any]]:
         """Additional attributes for the entity."""
         if (
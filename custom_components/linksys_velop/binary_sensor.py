@@ -3,11 +3,11 @@
 # region #-- imports --#
 from __future__ import annotations
 
-import asyncio
 import dataclasses
+import functools
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Callable, List, Mapping, Optional
+from datetime import datetime
+from typing import Any, Callable, List
 
 from homeassistant.components.binary_sensor import DOMAIN as ENTITY_DOMAIN
 from homeassistant.components.binary_sensor import (
@@ -17,18 +17,21 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.dispatcher import (
-    async_dispatcher_connect,
-    async_dispatcher_send,
-)
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from pyvelop.mesh import Mesh
 from pyvelop.node import Node
 
-from . import LinksysVelopMeshEntity, LinksysVelopNodeEntity, entity_cleanup
+from . import (
+    LinksysVelopDispatcherMixin,
+    LinksysVelopMeshEntity,
+    LinksysVelopNodeEntity,
+    entity_cleanup,
+)
 from .const import (
     CONF_COORDINATOR,
     DOMAIN,
@@ -47,8 +50,8 @@ _LOGGER = logging.getLogger(__name__)
 class OptionalLinksysVelopDescription:
     """Represent the optional attributes of the binary sensor description."""
 
-    extra_attributes: Optional[Callable] = None
-    state_value: Optional[Callable] = None
+    extra_attributes: Callable | None = None
+    state_value: Callable | None = None
 
 
 @dataclasses.dataclass
@@ -81,6 +84,42 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[LinksysVelopBinarySensorDescription, ...] = (
     ),
 )
 
+NODE_BINARY_SENSOR_DESCRIPTIONS: tuple[LinksysVelopBinarySensorDescription, ...] = (
+    LinksysVelopBinarySensorDescription(
+        device_class=BinarySensorDeviceClass.CONNECTIVITY,
+        extra_attributes=lambda n: n.connected_adapters[0]
+        if n.connected_adapters
+        else {},
+        key="status",
+        name="Status",
+    ),
+)
+
+NODE_UPDATE_AVAILABLE_DESCRIPTION: LinksysVelopBinarySensorDescription = (
+    LinksysVelopBinarySensorDescription(
+        device_class=BinarySensorDeviceClass.UPDATE,
+        key="update_available",
+        name="Update Available",
+        state_value=lambda n: n.firmware.get("version")
+        != n.firmware.get("latest_version"),
+    )
+)
+
+SPEEDTEST_STATUS_DESCRIPTION: LinksysVelopBinarySensorDescription = (
+    LinksysVelopBinarySensorDescription(
+        key="",
+        name="Speedtest Status",
+    )
+)
+
+# -- descriptions of binary sensors that are no longer created and should be removed --#
+REMOVED_BINARY_SENSOR_DESCRIPTIONS: tuple[LinksysVelopBinarySensorDescription, ...] = (
+    LinksysVelopBinarySensorDescription(
+        key="",
+        name="Check for Updates Status",
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -108,31 +147,20 @@ async def async_setup_entry(
         LinksysVelopMeshSpeedtestStatusBinarySensor(
             config_entry=config_entry,
             coordinator=coordinator,
-            description=LinksysVelopBinarySensorDescription(
-                key="",
-                name="Speedtest Status",
-            ),
+            description=SPEEDTEST_STATUS_DESCRIPTION,
         )
     )
 
     binary_sensors_update: List[LinksysVelopNodeBinarySensor] = []
     for node in mesh.nodes:
         # -- build the binary sensor for showing an update available for each node --#
-        binary_sensors_update.extend(
-            [
-                LinksysVelopNodeBinarySensor(
-                    config_entry=config_entry,
-                    coordinator=coordinator,
-                    node=node,
-                    description=LinksysVelopBinarySensorDescription(
-                        device_class=BinarySensorDeviceClass.UPDATE,
-                        key="update_available",
-                        name="Update Available",
-                        state_value=lambda n: n.firmware.get("version")
-                        != n.firmware.get("latest_version"),
-                    ),
-                ),
-            ]
+        binary_sensors_update.append(
+            LinksysVelopNodeBinarySensor(
+                config_entry=config_entry,
+                coordinator=coordinator,
+                node=node,
+                description=NODE_UPDATE_AVAILABLE_DESCRIPTION,
+            )
         )
 
         # -- build the additional binary sensors --#
@@ -142,15 +170,9 @@ async def async_setup_entry(
                     config_entry=config_entry,
                     coordinator=coordinator,
                     node=node,
-                    description=LinksysVelopBinarySensorDescription(
-                        device_class=BinarySensorDeviceClass.CONNECTIVITY,
-                        extra_attributes=lambda n: n.connected_adapters[0]
-                        if n.connected_adapters
-                        else {},
-                        key="status",
-                        name="Status",
-                    ),
-                ),
+                    description=binary_sensor_description,
+                )
+                for binary_sensor_description in NODE_BINARY_SENSOR_DESCRIPTIONS
             ]
         )
 
@@ -165,11 +187,9 @@ async def async_setup_entry(
         LinksysVelopMeshBinarySensor(
             config_entry=config_entry,
             coordinator=coordinator,
-            description=LinksysVelopBinarySensorDescription(
-                key="",
-                name="Check for Updates Status",
-            ),
+            description=binary_sensor_description,
         )
+        for binary_sensor_description in REMOVED_BINARY_SENSOR_DESCRIPTIONS
     ]
     if (
         UPDATE_DOMAIN is not None
@@ -185,6 +205,8 @@ async def async_setup_entry(
 class LinksysVelopMeshBinarySensor(LinksysVelopMeshEntity, BinarySensorEntity):
     """Representation of a binary sensor for the mesh."""
 
+    __slots__ = ()
+
     entity_description: LinksysVelopBinarySensorDescription
 
     def __init__(
@@ -200,8 +222,13 @@ class LinksysVelopMeshBinarySensor(LinksysVelopMeshEntity, BinarySensorEntity):
             config_entry=config_entry, coordinator=coordinator, description=description
         )
 
-    @property
-    def is_on(self) -> Optional[bool]:
+    def _handle_coordinator_update(self) -> None:
+        """Update the information when the coordinator updates."""
+        self.__dict__.pop("is_on", None)
+        super()._handle_coordinator_update()
+
+    @functools.cached_property
+    def is_on(self) -> bool | None:
         """Get the state of the binary sensor."""
         if self.entity_description.state_value:
             return self.entity_description.state_value(self._mesh)
@@ -212,6 +239,8 @@ class LinksysVelopMeshBinarySensor(LinksysVelopMeshEntity, BinarySensorEntity):
 class LinksysVelopNodeBinarySensor(LinksysVelopNodeEntity, BinarySensorEntity):
     """Representaion of a binary sensor related to a node."""
 
+    __slots__ = ()
+
     entity_description: LinksysVelopBinarySensorDescription
 
     def __init__(
@@ -231,8 +260,13 @@ class LinksysVelopNodeBinarySensor(LinksysVelopNodeEntity, BinarySensorEntity):
             node=node,
         )
 
-    @property
-    def is_on(self) -> Optional[bool]:
+    def _handle_coordinator_update(self) -> None:
+        """Update the information when the coordinator updates."""
+        self.__dict__.pop("is_on", None)
+        super()._handle_coordinator_update()
+
+    @functools.cached_property
+    def is_on(self) -> bool | None:
         """Get the state of the binary sensor."""
         if self.entity_description.state_value:
             return self.entity_description.state_value(self._node)
@@ -240,63 +274,106 @@ class LinksysVelopNodeBinarySensor(LinksysVelopNodeEntity, BinarySensorEntity):
             return getattr(self._node, self.entity_description.key, None)
 
 
-class LinksysVelopMeshSpeedtestStatusBinarySensor(LinksysVelopMeshBinarySensor):
+class LinksysVelopMeshSpeedtestStatusBinarySensor(
+    LinksysVelopDispatcherMixin, LinksysVelopMeshBinarySensor
+):
     """Representation of the Speedtest status binary sensor."""
 
-    _status_text: str = ""
+    __slots__ = (
+        "_closing",
+        "_current_interval",
+        "_debouncer",
+        "_remove_time_interval",
+        "_status_text",
+    )
+
+    _dispatcher_signal = SIGNAL_UPDATE_SPEEDTEST_STATUS
     _status_update_interval: int = 1
-    _remove_time_interval: Optional[Callable] = None
+    _status_update_interval_max: int = 10
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        config_entry: ConfigEntry,
+        description: LinksysVelopBinarySensorDescription,
+    ) -> None:
+        """Initialise."""
+        self._closing: bool = False
+        self._current_interval: float = self._status_update_interval
+        self._debouncer: Debouncer | None = None
+        self._remove_time_interval: Callable | None = None
+        self._status_text: str = ""
+        super().__init__(
+            config_entry=config_entry, coordinator=coordinator, description=description
+        )
 
     async def _async_get_speedtest_state(self, _: datetime | None = None):
         """Update the state of the binary sensor.
 
-        Triggers a time interval to ensure that data is checked for more regularly when the state
-        is on.
+        Schedules the next check, once this one has completed, to ensure that data is checked for
+        more regularly when the state is on.  The interval backs off whilst the status is unchanged
+        and is reset when it changes.
         """
-        self._status_text = await self._mesh.async_get_speedtest_state()
-        if self._status_text:
-            if not self._remove_time_interval:
-                self._remove_time_interval = async_track_time_interval(
-                    self.hass,
-                    self._async_get_speedtest_state,
-                    timedelta(seconds=self._status_update_interval),
+        status_text: str = await self._mesh.async_get_speedtest_state()
+        if self._closing:
+            return
+
+        if self._remove_time_interval:
+            self._remove_time_interval()
+            self._remove_time_interval = None
+
+        if status_text:
+            if status_text == self._status_text:
+                self._current_interval = min(
+                    self._current_interval * 1.5, self._status_update_interval_max
                 )
-        else:
-            if self._remove_time_interval:
-                self._remove_time_interval()
-                self._remove_time_interval = None
-                async_dispatcher_send(self.hass, SIGNAL_UPDATE_SPEEDTEST_RESULTS)
+            else:
+                self._current_interval = self._status_update_interval
+            self._remove_time_interval = async_call_later(
+                self.hass, self._current_interval, self._async_get_speedtest_state
+            )
+        elif self._status_text:
+            self._current_interval = self._status_update_interval
+            async_dispatcher_send(self.hass, SIGNAL_UPDATE_SPEEDTEST_RESULTS)
 
-        self.async_schedule_update_ha_state()
+        if status_text != self._status_text:
+            self._status_text = status_text
+            self.__dict__.pop("extra_state_attributes", None)
+            self.__dict__.pop("is_on", None)
+            self.async_write_ha_state()
 
-    def _handle_coordinator_update(self) -> None:
-        """Update the speedtest status information when the coordinator updates."""
-        asyncio.run_coroutine_threadsafe(
-            coro=self._async_get_speedtest_state(), loop=self.hass.loop
-        )
-        super()._handle_coordinator_update()
+    async def async_handle_dispatcher_update(self) -> None:
+        """Check the Speedtest status when asked to, coalescing repeated requests."""
+        if self._debouncer is not None:
+            await self._debouncer.async_call()
 
     async def async_added_to_hass(self) -> None:
         """Do stuff when entity is added to registry."""
-        self.async_on_remove(
-            async_dispatcher_connect(
-                hass=self.hass,
-                signal=SIGNAL_UPDATE_SPEEDTEST_STATUS,
-                target=self._async_get_speedtest_state,
-            )
+        self._debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=0.25,
+            immediate=True,
+            function=self._async_get_speedtest_state,
         )
+        # not registered with the coordinator, the status is only checked when signalled
+        self._async_connect_dispatcher()
 
     async def async_will_remove_from_hass(self) -> None:
         """Tidy up when removed."""
+        self._closing = True
+        if self._debouncer:
+            self._debouncer.async_cancel()
         if self._remove_time_interval:
             self._remove_time_interval()
+            self._remove_time_interval = None
 
-    @property
-    def extra_state_attributes(self) -> Mapping[str, Any]:
+    @functools.cached_property
+    def extra_state_attributes(self) -> dict[str, Any]:
         """Set the current stage of the test as an attribute."""
         return {"status": self._status_text}
 
-    @property
+    @functools.cached_property
     def is_on(self) -> bool:
         """Return True if the mesh is currently running a Speedtest, False otherwise."""
         return self._status_text != ""
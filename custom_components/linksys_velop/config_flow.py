@@ -3,8 +3,9 @@
 # region #-- imports --#
 from __future__ import annotations
 
+import functools
 import logging
-from typing import List
+from typing import Any, Callable, Dict, List, Set, Tuple
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
@@ -32,6 +33,7 @@ from .const import (
     CONF_API_REQUEST_TIMEOUT,
     CONF_DEVICE_TRACKERS,
     CONF_FLOW_NAME,
+    CONF_HOST_INDEX,
     CONF_LOGGING_JNAP_RESPONSE,
     CONF_LOGGING_MODE,
     CONF_LOGGING_SERIAL,
@@ -65,91 +67,138 @@ STEP_TIMERS: str = "timers"
 _LOGGER = logging.getLogger(__name__)
 
 
+def _get_host_index(hass: HomeAssistant) -> Dict[str, config_entries.ConfigEntry]:
+    """Get the config entries for the integration indexed by host.
+
+    The index is dropped whenever a config entry is set up or unloaded.
+    """
+    domain_data: dict = hass.data.setdefault(DOMAIN, {})
+    if (ret := domain_data.get(CONF_HOST_INDEX)) is None:
+        ret = {}
+        for config_entry in hass.config_entries.async_entries(DOMAIN):
+            ret.setdefault(config_entry.options.get(CONF_NODE), config_entry)
+        domain_data[CONF_HOST_INDEX] = ret
+
+    return ret
+
+
 def _is_mesh_by_host(
     hass: HomeAssistant, host: str
 ) -> config_entries.ConfigEntry | None:
     """Check if the given host is a Mesh."""
-    current_entries = hass.config_entries.async_entries(DOMAIN)
-    matching_entry = [
-        config_entry
-        for config_entry in current_entries
-        if config_entry.options.get(CONF_NODE) == host
-    ]
-    if matching_entry:
-        return matching_entry[0]
+    matching_entry = _get_host_index(hass=hass).get(host)
+    if matching_entry and (
+        matching_entry.options.get(CONF_NODE) != host
+        or hass.config_entries.async_get_entry(matching_entry.entry_id)
+        is not matching_entry
+    ):  # the index is out of date so rebuild it
+        hass.data[DOMAIN].pop(CONF_HOST_INDEX, None)
+        matching_entry = _get_host_index(hass=hass).get(host)
+
+    return matching_entry
+
+
+# -- the options, their defaults and validators for the steps that are built from a table --#
+_LOGGING_DEFAULTS: Tuple[Tuple[str, Any, Callable], ...] = (
+    (CONF_LOGGING_SERIAL, DEF_LOGGING_SERIAL, bool),
+    (CONF_LOGGING_JNAP_RESPONSE, DEF_LOGGING_JNAP_RESPONSE, bool),
+    (CONF_LOGGING_MODE, DEF_LOGGING_MODE, vol.In(LOGGING_STATES)),
+)
+_TIMER_DEFAULTS: Tuple[Tuple[str, Any, Callable], ...] = (
+    (CONF_SCAN_INTERVAL, DEF_SCAN_INTERVAL, cv.positive_int),
+    (
+        CONF_SCAN_INTERVAL_DEVICE_TRACKER,
+        DEF_SCAN_INTERVAL_DEVICE_TRACKER,
+        cv.positive_int,
+    ),
+    (CONF_CONSIDER_HOME, DEF_CONSIDER_HOME, cv.positive_int),
+    (CONF_API_REQUEST_TIMEOUT, DEF_API_REQUEST_TIMEOUT, cv.positive_float),
+)
+_SCHEMA_DEFAULTS: Dict[str, Tuple[Tuple[str, Any, Callable], ...]] = {
+    STEP_LOGGING: _LOGGING_DEFAULTS,
+    STEP_TIMERS: _TIMER_DEFAULTS,
+}
 
 
-async def _async_build_schema_with_user_input(
-    step: str, user_input: dict, **kwargs
+@functools.lru_cache(maxsize=32)
+def _build_schema(
+    step: str,
+    defaults: Tuple[Tuple[str, Any], ...],
+    multi_select_contents: Tuple[Tuple[str, str], ...] = (),
 ) -> vol.Schema:
-    """Build the input and validation schema for the config UI.
+    """Build the schema for a step.
 
-    :param step: the step we're in for a configuration or installation of the integration
-    :param user_input: the data that should be used as defaults
-    :param kwargs: additional information that might be required
-    :return: the schema including necessary restrictions, defaults, pre-selections etc.
+    The arguments are hashable so that the schema can be reused for the same defaults.
+
+    :param step: the step that the schema is for
+    :param defaults: the option keys and the values to use as defaults
+    :param multi_select_contents: the options to show in a multi-select
+    :return: the schema
     """
+    user_input: dict = dict(defaults)
     schema = {}
-    if step == STEP_USER:
-        schema = {
-            vol.Required(CONF_NODE, default=user_input.get(CONF_NODE, "")): str,
-            vol.Required(CONF_PASSWORD, default=user_input.get(CONF_PASSWORD, "")): str,
-        }
-    elif step == STEP_TIMERS:
+    if step in _SCHEMA_DEFAULTS:
         schema = {
-            vol.Required(
-                CONF_SCAN_INTERVAL,
-                default=user_input.get(CONF_SCAN_INTERVAL, DEF_SCAN_INTERVAL),
-            ): cv.positive_int,
-            vol.Required(
-                CONF_SCAN_INTERVAL_DEVICE_TRACKER,
-                default=user_input.get(
-                    CONF_SCAN_INTERVAL_DEVICE_TRACKER, DEF_SCAN_INTERVAL_DEVICE_TRACKER
-                ),
-            ): cv.positive_int,
-            vol.Required(
-                CONF_CONSIDER_HOME,
-                default=user_input.get(CONF_CONSIDER_HOME, DEF_CONSIDER_HOME),
-            ): cv.positive_int,
-            vol.Required(
-                CONF_API_REQUEST_TIMEOUT,
-                default=user_input.get(
-                    CONF_API_REQUEST_TIMEOUT, DEF_API_REQUEST_TIMEOUT
-                ),
-            ): cv.positive_float,
+            vol.Required(key, default=user_input.get(key, default)): validator
+            for key, default, validator in _SCHEMA_DEFAULTS[step]
         }
     elif step == STEP_DEVICE_TRACKERS:
+        contents: dict = dict(multi_select_contents)
         valid_trackers = [
             tracker
-            for tracker in user_input.get(CONF_DEVICE_TRACKERS, [])
-            if tracker in kwargs["multi_select_contents"].keys()
+            for tracker in user_input.get(CONF_DEVICE_TRACKERS, ())
+            if tracker in contents
         ]
         schema = {
             vol.Optional(CONF_DEVICE_TRACKERS, default=valid_trackers): cv.multi_select(
-                kwargs["multi_select_contents"]
+                contents
             )
         }
-    elif step == STEP_LOGGING:
-        schema = {
-            vol.Required(
-                CONF_LOGGING_SERIAL,
-                default=user_input.get(CONF_LOGGING_SERIAL, DEF_LOGGING_SERIAL),
-            ): bool,
-            vol.Required(
-                CONF_LOGGING_JNAP_RESPONSE,
-                default=user_input.get(
-                    CONF_LOGGING_JNAP_RESPONSE, DEF_LOGGING_JNAP_RESPONSE
-                ),
-            ): bool,
-            vol.Required(
-                CONF_LOGGING_MODE,
-                default=user_input.get(CONF_LOGGING_MODE, DEF_LOGGING_MODE),
-            ): vol.In(LOGGING_STATES),
-        }
 
     return vol.Schema(schema)
 
 
+async def _async_build_schema_with_user_input(
+    step: str, user_input: dict, **kwargs
+) -> vol.Schema:
+    """Build the input and validation schema for the config UI.
+
+    Schemas other than the user step are cached by the defaults they are built from.  The user
+    step is built each time so that the password isn't held on to.
+
+    :param step: the step we're in for a configuration or installation of the integration
+    :param user_input: the data that should be used as defaults
+    :param kwargs: additional information that might be required
+    :return: the schema including necessary restrictions, defaults, pre-selections etc.
+    """
+    if step == STEP_USER:
+        return vol.Schema(
+            {
+                vol.Required(CONF_NODE, default=user_input.get(CONF_NODE, "")): str,
+                vol.Required(
+                    CONF_PASSWORD, default=user_input.get(CONF_PASSWORD, "")
+                ): str,
+            }
+        )
+
+    multi_select_contents: Tuple[Tuple[str, str], ...] = ()
+    if step == STEP_DEVICE_TRACKERS:
+        defaults = (
+            (CONF_DEVICE_TRACKERS, tuple(user_input.get(CONF_DEVICE_TRACKERS, []))),
+        )
+        multi_select_contents = tuple(kwargs["multi_select_contents"].items())
+    else:
+        defaults = tuple(
+            (key, user_input.get(key, default))
+            for key, default, _ in _SCHEMA_DEFAULTS.get(step, ())
+        )
+
+    try:
+        return _build_schema(step, defaults, multi_select_contents)
+    except TypeError:  # unhashable defaults so the schema can't be cached
+        return _build_schema.__wrapped__(step, defaults, multi_select_contents)
+
+
 async def _async_get_devices(mesh: Mesh) -> dict:
     """Get the devices from the mesh for display purposes.
 
@@ -158,12 +207,12 @@ async def _async_get_devices(mesh: Mesh) -> dict:
     :param mesh: the Mesh object
     :return: a dictionary containing the devices to present
     """
-    ret: dict = {}
-
     devices: List[Device] = await mesh.async_get_devices()
-    for device in devices:
-        for adapter in device.network:
-            ret[device.unique_id] = f"{device.name} --> {adapter.get('mac')}"
+    ret: dict = {
+        device.unique_id: f"{device.name} --> {device.network[-1].get('mac')}"
+        for device in devices
+        if device.network
+    }
 
     return ret
 
@@ -185,6 +234,7 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._finish: bool = False
         self._options: dict = {}
         self._log_formatter: Logger = Logger()
+        self._primary_serial: str | None = None
 
     @staticmethod
     @callback
@@ -230,6 +280,7 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         else:
             _LOGGER.debug(self._log_formatter.format("no exceptions"))
 
+        # the progress form only moves on when the flow is configured again, so this is needed
         self.hass.async_create_task(
             self.hass.config_entries.flow.async_configure(flow_id=self.flow_id)
         )
@@ -311,20 +362,22 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._log_formatter.format("entered, discovery_info: %s"), discovery_info
         )
 
-        # region #-- get the important info --#
-        _host = discovery_info.ssdp_headers.get("_host", "")
-        _manufacturer = discovery_info.upnp.get("manufacturer", "")
-        _model = discovery_info.upnp.get("modelNumber", "")
-        _model_description = discovery_info.upnp.get("modelDescription", "")
-        _serial = discovery_info.upnp.get("serialNumber", "")
-        # endregion
+        upnp: dict = discovery_info.upnp
 
         # region #-- check for a valid Velop device --#
+        _model_description = upnp.get("modelDescription", "")
         if "velop" not in _model_description.lower():
             _LOGGER.debug(self._log_formatter.format("not a Velop model"))
             return self.async_abort(reason="not_velop")
         # endregion
 
+        # region #-- get the important info --#
+        _host = discovery_info.ssdp_headers.get("_host", "")
+        _manufacturer = upnp.get("manufacturer", "")
+        _model = upnp.get("modelNumber", "")
+        _serial = upnp.get("serialNumber", "")
+        # endregion
+
         # region #-- try and update the config entry if it exists and doesn't have a unique_id --#
         # This region assumes that the host is unique for the Mesh (it should be but isn't guaranteed)
         # It will match on host and then update the config entry with the serial number, then abort
@@ -387,12 +440,12 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if not self.unique_id:
             _LOGGER.debug(self._log_formatter.format("no unique_id"))
             # region #-- get the unique_id --#
-            unique_id: str | None = None
-            if self._mesh:
+            if self._primary_serial is None and self._mesh:
                 nodes: List[Node] = self._mesh.nodes
-                for node in nodes:
-                    if node.type == "primary":
-                        unique_id = node.serial
+                self._primary_serial = next(
+                    (node.serial for node in nodes if node.type == "primary"), None
+                )
+            unique_id: str | None = self._primary_serial
             # end region
 
             # region #-- do we have matching host? --#
@@ -442,18 +495,21 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # endregion
 
         # region #-- try and find this device --#
-        device_info = [
-            device
-            for device in devices
-            if device.upnp.get("serialNumber", "") == unique_id
-        ]
+        device_info: SsdpServiceInfo | None = next(
+            (
+                device
+                for device in devices
+                if device.upnp.get("serialNumber", "") == unique_id
+            ),
+            None,
+        )
 
-        if not device_info:
+        if device_info is None:
             _LOGGER.debug(self._log_formatter.format("device not found"))
             return self.async_abort(reason="not_found")
         # endregion
 
-        return await self.async_step_ssdp(device_info[0])
+        return await self.async_step_ssdp(device_info)
 
     async def async_step_user(self, user_input=None) -> data_entry_flow.FlowResult:
         """Handle a flow initiated by the user."""
@@ -485,6 +541,17 @@ class LinksysOptionsFlowHandler(config_entries.OptionsFlow):
         self._errors: dict = {}
         self._options: dict = dict(config_entry.options)
         self._log_formatter: Logger = Logger()
+        self._mesh: Mesh | None = None
+
+    def _get_mesh(self) -> Mesh:
+        """Get the Mesh object for the flow, creating it on first use."""
+        if self._mesh is None:
+            self._mesh = Mesh(
+                node=self._config_entry.options[CONF_NODE],
+                password=self._config_entry.options[CONF_PASSWORD],
+                session=async_get_clientsession(hass=self.hass),
+            )
+        return self._mesh
 
     async def async_step_device_trackers(
         self, user_input=None
@@ -500,17 +567,14 @@ class LinksysOptionsFlowHandler(config_entries.OptionsFlow):
             ] = er.async_entries_for_config_entry(
                 registry=entity_registry, config_entry_id=self._config_entry.entry_id
             )
-            device_tracker_entities: List[er.RegistryEntry] = [
-                device_tracker
-                for device_tracker in config_entry_entities
-                if device_tracker.unique_id.startswith(
-                    f"{self._config_entry.entry_id}::device_tracker::"
-                )
-            ]
-
-            for device_tracker in device_tracker_entities:
-                uid: str = device_tracker.unique_id.split("::")[-1]
-                if uid not in user_input.get(CONF_DEVICE_TRACKERS):
+            prefix: str = f"{self._config_entry.entry_id}::device_tracker::"
+            selected: Set[str] = set(user_input.get(CONF_DEVICE_TRACKERS) or ())
+            for device_tracker in config_entry_entities:
+                if not device_tracker.unique_id.startswith(prefix):
+                    continue
+
+                uid: str = device_tracker.unique_id.rsplit("::", 1)[-1]
+                if uid not in selected:
                     _LOGGER.debug(
                         self._log_formatter.format(
                             "removing the device tracker entity for %s"
@@ -523,12 +587,7 @@ class LinksysOptionsFlowHandler(config_entries.OptionsFlow):
             self._options.update(user_input)
             return self.async_step_logging()
 
-        mesh = Mesh(
-            node=self._config_entry.options[CONF_NODE],
-            password=self._config_entry.options[CONF_PASSWORD],
-            session=async_get_clientsession(hass=self.hass),
-        )
-        devices: dict = await _async_get_devices(mesh=mesh)
+        devices: dict = await _async_get_devices(mesh=self._get_mesh())
 
         return self.async_show_form(
             step_id=STEP_DEVICE_TRACKERS,
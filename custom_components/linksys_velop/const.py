@@ -1,7 +1,8 @@
 """Constants for Linksys Velop."""
 
 # region #-- imports --#
-from typing import Dict, List, Optional
+import types
+from typing import Mapping, Tuple
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
 from homeassistant.components.button import DOMAIN as BUTTON_DOMAIN
@@ -26,14 +27,21 @@ CONF_COORDINATOR_MESH: str = "mesh"
 CONF_DEVICE_TRACKERS: str = "tracked"
 CONF_ENTRY_RELOAD: str = "reloading"
 CONF_FLOW_NAME: str = "name"
+CONF_HOST_INDEX: str = "host_index"
 CONF_LOGGING_JNAP_RESPONSE: str = "logging_jnap_response"
+CONF_LOGGING_LEVELS: str = "logging_levels"
 CONF_LOGGING_MODE: str = "logging_mode"
 CONF_LOGGING_SERIAL: str = "logging_serial"
+CONF_MESH_DEVICE_ID: str = "mesh_device_id"
 CONF_NODE: str = "node"
 CONF_NODE_IMAGES: str = "node_images"
+CONF_NODES_BY_UNIQUE_ID: str = "nodes_by_uid"
+CONF_REGISTRY_INDEX: str = "registry_index"
+CONF_REGISTRY_INVALIDATORS: str = "registry_invalidators"
 CONF_SCAN_INTERVAL_DEVICE_TRACKER: str = "scan_interval_device_tracker"
 CONF_SERVICES_HANDLER: str = "services_handler"
 CONF_TITLE_PLACEHOLDERS: str = "title_placeholders"
+CONF_UNSUB_REGISTRY_LISTENER: str = "unsub_registry_listener"
 CONF_UNSUB_UPDATE_LISTENER: str = "unsub_update_listener"
 
 DEF_API_REQUEST_TIMEOUT: int = 10
@@ -47,20 +55,26 @@ DEF_SCAN_INTERVAL_DEVICE_TRACKER: int = 10
 
 EVENT_NEW_PARENT_NODE: str = f"{DOMAIN}_new_primary_node"
 
-LOGGING_STATES: Dict[str, str] = {  # order defines order of options on screen
-    "off": "Off",
-    "single": "Single poll",
-}
+LOGGING_STATES: Mapping[str, str] = types.MappingProxyType(
+    {  # order defines order of options on screen
+        "off": "Off",
+        "single": "Single poll",
+    }
+)
 
-PLATFORMS: List[Optional[str]] = [
-    BINARY_SENSOR_DOMAIN,
-    BUTTON_DOMAIN,
-    DEVICE_TRACKER_DOMAIN,
-    SELECT_DOMAIN,
-    SENSOR_DOMAIN,
-    SWITCH_DOMAIN,
-    UPDATE_DOMAIN,
-]
+PLATFORMS: Tuple[str, ...] = tuple(
+    platform
+    for platform in (
+        BINARY_SENSOR_DOMAIN,
+        BUTTON_DOMAIN,
+        DEVICE_TRACKER_DOMAIN,
+        SELECT_DOMAIN,
+        SENSOR_DOMAIN,
+        SWITCH_DOMAIN,
+        UPDATE_DOMAIN,
+    )
+    if platform is not None  # the update platform isn't available in older versions
+)
 
 SIGNAL_UPDATE_DEVICE_TRACKER: str = "update_device_tracker"
 SIGNAL_UPDATE_SPEEDTEST_RESULTS: str = "update_speedtest_results"
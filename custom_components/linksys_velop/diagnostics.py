@@ -116,11 +116,8 @@ async def async_get_device_diagnostics(
         }
     }
 
-    node: List[Node] = [
-        n
-        for n in mesh.nodes
-        if mesh.nodes and n.serial == next(iter(device.identifiers))[1]
-    ]
+    serial: str = next(iter(device.identifiers))[1]
+    node: List[Node] = [n for n in mesh.nodes if n.serial == serial]
     if node:
         ret["node"] = node[0].__dict__
 
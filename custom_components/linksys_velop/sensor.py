@@ -16,7 +16,6 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
@@ -26,7 +25,12 @@ from pyvelop.device import Device
 from pyvelop.mesh import Mesh
 from pyvelop.node import Node
 
-from . import LinksysVelopMeshEntity, LinksysVelopNodeEntity, entity_cleanup
+from . import (
+    LinksysVelopDispatcherMixin,
+    LinksysVelopMeshEntity,
+    LinksysVelopNodeEntity,
+    entity_cleanup,
+)
 from .const import (
     CONF_COORDINATOR,
     CONF_NODE_IMAGES,
@@ -393,12 +397,15 @@ class LinksysVelopNodeSensor(LinksysVelopNodeEntity, SensorEntity):
         return getattr(self._node, self.entity_description.key, None)
 
 
-class LinksysVelopMeshSpeedtestLatestSensor(LinksysVelopMeshSensor):
+class LinksysVelopMeshSpeedtestLatestSensor(
+    LinksysVelopDispatcherMixin, LinksysVelopMeshSensor
+):
     """Representation of the sensor the latest Speedtest results."""
 
+    _dispatcher_signal = SIGNAL_UPDATE_SPEEDTEST_RESULTS
     _value: Dict = {}
 
-    async def _get_results(self):
+    async def async_handle_dispatcher_update(self) -> None:
         """Refresh the Speedtest details from the API."""
         results: List = await self._mesh.async_get_speedtest_results(
             only_completed=True, only_latest=True
@@ -406,7 +413,7 @@ class LinksysVelopMeshSpeedtestLatestSensor(LinksysVelopMeshSensor):
         if results:
             self._value = results[0]
 
-        self.async_schedule_update_ha_state()
+        self.async_write_ha_state()
 
     def _handle_coordinator_update(self) -> None:
         """Update the status information when the coordinator updates."""
@@ -417,13 +424,7 @@ class LinksysVelopMeshSpeedtestLatestSensor(LinksysVelopMeshSensor):
         """Register for callbacks and set initial value."""
         await super().async_added_to_hass()
         self._value = self._mesh.latest_speedtest_result
-        self.async_on_remove(
-            async_dispatcher_connect(
-                hass=self.hass,
-                signal=SIGNAL_UPDATE_SPEEDTEST_RESULTS,
-                target=self._get_results,
-            )
-        )
+        self._async_connect_dispatcher()
 
     @property
     def extra_state_attributes(self) -> Mapping[str, Any]:
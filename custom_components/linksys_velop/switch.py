@@ -4,7 +4,7 @@
 import dataclasses
 import logging
 from abc import ABC
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from homeassistant.components.switch import DOMAIN as ENTITY_DOMAIN
 from homeassistant.components.switch import (
@@ -25,6 +25,15 @@ from .const import CONF_COORDINATOR, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+_GUEST_NETWORK_KEYS: Tuple[str, ...] = tuple(f"network {idx}" for idx in range(16))
+
+
+def _guest_network_attributes(networks: List[Any]) -> Dict[str, Any]:
+    """Build the attributes for the guest networks using the pre-built keys."""
+    if len(networks) <= len(_GUEST_NETWORK_KEYS):
+        return dict(zip(_GUEST_NETWORK_KEYS, networks))
+    return {f"network {idx}": network for idx, network in enumerate(networks)}
+
 
 # region #-- switch entity descriptions --#
 @dataclasses.dataclass
@@ -60,10 +69,7 @@ class LinksysVelopSwitchDescription(
 
 SWITCH_DESCRIPTIONS: tuple[LinksysVelopSwitchDescription, ...] = (
     LinksysVelopSwitchDescription(
-        extra_attributes=lambda m: {
-            f"network {idx}": network
-            for idx, network in enumerate(m.guest_wifi_details)
-        },
+        extra_attributes=lambda m: _guest_network_attributes(m.guest_wifi_details),
         icon_off="hass:wifi-off",
         icon_on="hass:wifi",
         key="guest_wifi_enabled",
@@ -165,16 +171,18 @@ class LinksysVelopMeshSwitch(LinksysVelopMeshEntity, SwitchEntity, ABC):
         action = getattr(self._mesh, self.entity_description.turn_off)
         if isinstance(action, Callable):
             await action(**self.entity_description.turn_off_args)
-            self._value = False
-            await self.async_update_ha_state()
+            if self._value is not False:
+                self._value = False
+                self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         action = getattr(self._mesh, self.entity_description.turn_on)
         if isinstance(action, Callable):
             await action(**self.entity_description.turn_on_args)
-            self._value = True
-            await self.async_update_ha_state()
+            if self._value is not True:
+                self._value = True
+                self.async_write_ha_state()
 
     @property
     def icon(self) -> Optional[str]:
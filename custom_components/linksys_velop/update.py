@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import logging
 from abc import ABC
 from typing import List
@@ -21,7 +22,7 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from pyvelop.mesh import Mesh
 from pyvelop.node import Node
 
-from . import LinksysVelopNodeEntity, entity_cleanup
+from . import LinksysVelopNodeEntity
 from .const import CONF_COORDINATOR, CONF_NODE_IMAGES, DOMAIN
 
 # endregion
@@ -31,27 +32,20 @@ _LOGGER = logging.getLogger(__name__)
 
 # region #-- update entity descriptions --#
 @dataclasses.dataclass
-class OptionalLinksysVelopDescription:
-    """Represent the optional attributes of the update description."""
-
-
-@dataclasses.dataclass
-class RequiredLinksysVelopDescription:
-    """Represent the required attributes of the update description."""
-
-
-@dataclasses.dataclass
-class LinksysVelopUpdateDescription(
-    OptionalLinksysVelopDescription,
-    UpdateEntityDescription,
-    RequiredLinksysVelopDescription,
-):
+class LinksysVelopUpdateDescription(UpdateEntityDescription):
     """Describes update entity."""
 
 
 # endregion
 
 
+UPDATE_DESCRIPTION: LinksysVelopUpdateDescription = LinksysVelopUpdateDescription(
+    device_class=UpdateDeviceClass.FIRMWARE,
+    key="",
+    name="Update",
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -61,33 +55,20 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][config_entry.entry_id][CONF_COORDINATOR]
     mesh: Mesh = coordinator.data
 
-    update_entities: List[LinksysVelopNodeUpdate] = []
+    nodes: List[Node] = mesh.nodes
 
     # region #-- node sensors --#
-    node: Node
-    for node in mesh.nodes:
-        update_entities.extend(
-            [
-                LinksysVelopNodeUpdate(
-                    config_entry=config_entry,
-                    coordinator=coordinator,
-                    node=node,
-                    description=LinksysVelopUpdateDescription(
-                        device_class=UpdateDeviceClass.FIRMWARE,
-                        key="",
-                        name="Update",
-                    ),
-                ),
-            ]
+    async_add_entities(
+        LinksysVelopNodeUpdate(
+            config_entry=config_entry,
+            coordinator=coordinator,
+            node=node,
+            description=UPDATE_DESCRIPTION,
         )
+        for node in nodes
+    )
     # endregion
 
-    async_add_entities(update_entities)
-
-    sensors_to_remove: List = []
-    if sensors_to_remove:
-        entity_cleanup(config_entry=config_entry, entities=sensors_to_remove, hass=hass)
-
 
 class LinksysVelopNodeUpdate(LinksysVelopNodeEntity, UpdateEntity, ABC):
     """Representation of an update entity for a node."""
@@ -110,6 +91,12 @@ class LinksysVelopNodeUpdate(LinksysVelopNodeEntity, UpdateEntity, ABC):
             node=node,
         )
 
+    def _handle_coordinator_update(self) -> None:
+        """Update the firmware information when the coordinator updates."""
+        self.__dict__.pop("installed_version", None)
+        self.__dict__.pop("latest_version", None)
+        super()._handle_coordinator_update()
+
     @property
     def auto_update(self) -> bool:
         """Return the status of auto-update.
@@ -130,12 +117,12 @@ class LinksysVelopNodeUpdate(LinksysVelopNodeEntity, UpdateEntity, ABC):
 
         return ret
 
-    @property
+    @functools.cached_property
     def installed_version(self) -> str | None:
         """Retrieve the currently installed firmware version."""
-        return self._node.firmware.get("version", None)
+        return self._node.firmware.get("version")
 
-    @property
+    @functools.cached_property
     def latest_version(self) -> str | None:
         """Retrieve the latest firmware version available."""
-        return self._node.firmware.get("latest_version", None)
+        return self._node.firmware.get("latest_version")